@@ -1,12 +1,15 @@
 import os
 import sys
+import time
 import traceback
 import concurrent.futures
+import itertools
+import multiprocessing
 import ctypes
 import platform
-import numpy as np
-from PIL import Image
-import cv2
+import shutil
+from dataclasses import dataclass, field
+from PIL import Image, UnidentifiedImageError, features
 import pillow_heif
 from pillow_heif import register_heif_opener
 from PySide6.QtWidgets import (
@@ -24,13 +27,21 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSpinBox,
     QTextEdit,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 from PySide6.QtGui import QIcon
-from PySide6.QtCore import Qt, QThreadPool, QRunnable, Signal, QObject, Slot
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Qt,
+    Signal,
+    Slot,
+)
 
 register_heif_opener()
 
@@ -44,6 +55,39 @@ FORMAT_MAPPING = {
     "HEIC": "HEIC",  # We'll handle this specially
 }
 
+# Name Pillow reports for a source file that is already encoded as the given
+# output format, so it can be copied as-is (e.g. .jpeg -> JPG, .tif -> TIFF)
+COPYABLE_SOURCE_FORMATS = {
+    "JPG": "JPEG",
+    "PNG": "PNG",
+    "BMP": "BMP",
+    "TIFF": "TIFF",
+    "WEBP": "WEBP",
+    "HEIC": "HEIF",
+}
+
+# Encoder settings per PIL format, favouring encode speed over file size
+# (Pillow defaults to zlib level 6 for PNG). WEBP's method (encoder effort)
+# comes from ConversionSettings.webp_method instead.
+SAVE_KWARGS = {
+    "JPEG": {"quality": 90, "optimize": False},
+    "PNG": {"compress_level": 1},
+    "WEBP": {"quality": 75, "lossless": False},
+}
+
+# Minimum seconds between progress signals from a running conversion (~30 Hz)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+# Log lines from a running conversion are sent to the GUI in batches, flushed
+# once this many lines are waiting or this many seconds have passed
+LOG_FLUSH_LINES = 64
+LOG_FLUSH_INTERVAL = 0.2
+
+# Directory scans with at least this many top-level subdirectories are
+# split across PARALLEL_SCAN_WORKERS threads
+PARALLEL_SCAN_MIN_SUBDIRS = 32
+PARALLEL_SCAN_WORKERS = 4
+
 # Formats we can save to
 SUPPORTED_OUTPUT_FORMATS = ["JPG", "PNG", "BMP", "TIFF", "WEBP", "HEIC"]
 
@@ -61,6 +105,190 @@ SUPPORTED_INPUT_EXTENSIONS = (
 )
 
 
+@dataclass(frozen=True)
+class ConversionSettings:
+    """Per-batch options shipped to each worker process"""
+
+    output_format: str
+    output_dir: str
+    append_suffix: bool
+    replace_files: bool
+    heic_quality: int = 90
+    webp_method: int = 0
+    debug: bool = False
+    verbose: bool = False
+
+    # Derived once per batch instead of on every file
+    format_name: str = field(init=False)
+    pil_format: str = field(init=False)
+    extension: str = field(init=False)
+
+    def __post_init__(self):
+        format_name = self.output_format.upper()
+        object.__setattr__(self, "format_name", format_name)
+        object.__setattr__(self, "pil_format", FORMAT_MAPPING.get(format_name, format_name))
+        object.__setattr__(self, "extension", self.output_format.lower())
+
+
+def describe_jpeg_codec():
+    """Name the JPEG library Pillow is using, for the startup log"""
+    if features.check_feature("libjpeg_turbo"):
+        return f"libjpeg-turbo {features.version_feature('libjpeg_turbo')}"
+    return f"libjpeg {features.version_codec('jpg')} (no libjpeg-turbo SIMD acceleration)"
+
+
+def save_as_heic(image, output_path, heic_quality):
+    """Save image as HEIC using pillow_heif directly"""
+    # pillow_heif takes the PIL image as-is (L/RGB/RGBA and friends),
+    # so there is no need for a numpy/BGR round-trip here
+    quality = max(0, min(100, heic_quality))
+    pillow_heif.from_pillow(image).save(output_path, quality=quality)
+
+
+def _discard_log(message):
+    pass
+
+
+def save_image(image, output_path, settings, log):
+    """Encode a loaded image to output_path in settings.output_format"""
+    # Convert to RGB for formats that don't support RGBA
+    if (
+        settings.format_name in ["JPG", "JPEG"]
+        and image.mode in ["RGBA", "P"]
+    ):
+        image = image.convert("RGB")
+        log(f"Converting image to RGB mode for {settings.output_format}")
+
+    # Special handling for HEIC output
+    if settings.format_name == "HEIC":
+        log("Using pillow_heif for HEIC output")
+        save_as_heic(image, output_path, settings.heic_quality)
+    else:
+        # Save with proper format
+        pil_format = settings.pil_format
+        save_kwargs = SAVE_KWARGS.get(pil_format, {})
+        if pil_format == "WEBP":
+            save_kwargs = {**save_kwargs, "method": max(0, min(6, settings.webp_method))}
+        image.save(output_path, format=pil_format, **save_kwargs)
+
+
+def convert_image(settings, input_path):
+    """Convert a single file.
+
+    Runs inside a worker process, so instead of emitting Qt signals it
+    returns a (success, log_messages, error) tuple for the caller to
+    report on the GUI side. error is None or an
+    (error_type, error_msg, traceback_or_None) tuple.
+    """
+    logs = []
+    # Per-file progress notes are only kept in verbose mode; skips and
+    # errors are always reported
+    note = logs.append if settings.verbose else _discard_log
+    try:
+        # Normalize path separators
+        input_path = os.path.normpath(input_path)
+
+        # A file that disappeared since the scan surfaces as FileNotFoundError
+        # from Image.open below, so there's no separate exists() check
+
+        # Same-format files were already filtered out by ImageConverter.run
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+
+        if settings.append_suffix and not settings.replace_files:
+            base_name += "_out"
+
+        output_dir = settings.output_dir if not settings.replace_files else os.path.dirname(
+            input_path
+        )
+        output_path = os.path.join(
+            output_dir, f"{base_name}.{settings.extension}"
+        )
+
+        # Log the conversion attempt
+        note(f"Converting: {input_path} to {output_path}")
+
+        # Open image with Pillow through our own handle, so the file is
+        # closed before encoding starts
+        with open(input_path, "rb") as fp:
+            try:
+                image = Image.open(fp)
+            except UnidentifiedImageError:
+                # Pillow names the file object rather than the file here
+                raise UnidentifiedImageError(
+                    f"cannot identify image file {input_path!r}"
+                ) from None
+
+            # Only the header has been read so far. A file already encoded in
+            # the output format (e.g. photo.jpeg -> photo.jpg) only needs a
+            # new name, so keep the encoded bytes
+            copy_as_is = image.format == COPYABLE_SOURCE_FORMATS.get(settings.format_name)
+
+            if not copy_as_is:
+                # Decode fully while the file is still open
+                image.load()
+
+        if copy_as_is:
+            note(f"Already {image.format} encoded, copying without re-encoding")
+            if settings.replace_files:
+                os.replace(input_path, output_path)
+            else:
+                shutil.copyfile(input_path, output_path)
+        else:
+            save_image(image, output_path, settings, note)
+            if settings.replace_files:
+                os.remove(input_path)
+
+        note(f"Successfully converted: {input_path}")
+        return True, logs, None
+    except Exception as e:
+        # A file that disappeared since the scan is skipped. Anything else,
+        # including a missing output directory, is a real error.
+        if isinstance(e, FileNotFoundError) and e.filename == input_path:
+            logs.append(f"Skipping: {input_path} - file no longer exists")
+            return False, logs, None
+
+        # A full traceback is slow to build and rarely useful to users, so
+        # only collect it in debug mode
+        reason = traceback.format_exception_only(type(e), e)[-1].strip()
+        error_msg = f"Error converting {input_path}: {reason}"
+        error_details = traceback.format_exc() if settings.debug else None
+        return False, logs, (type(e).__name__, error_msg, error_details)
+
+
+def _plan_worker_cpus(max_workers):
+    """Pick one CPU per worker, spreading over physical cores before SMT siblings.
+
+    Returns an empty list where affinity can't be set (non-Linux).
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return []
+
+    primary, siblings = [], []
+    for cpu in sorted(os.sched_getaffinity(0)):
+        # The first entry of thread_siblings_list is the core's primary thread
+        topology = f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list"
+        try:
+            with open(topology) as f:
+                first_sibling = int(f.read().replace("-", ",").split(",")[0])
+        except (OSError, ValueError):
+            first_sibling = cpu
+        (primary if first_sibling == cpu else siblings).append(cpu)
+
+    cpus = primary + siblings
+    return [cpus[rank % len(cpus)] for rank in range(max_workers)]
+
+
+def _pin_worker(worker_counter, cpu_plan):
+    """Process pool initializer: pin the new worker to the next planned CPU"""
+    with worker_counter.get_lock():
+        rank = worker_counter.value
+        worker_counter.value += 1
+    try:
+        os.sched_setaffinity(0, {cpu_plan[rank % len(cpu_plan)]})
+    except OSError:
+        pass  # Not fatal, the worker just stays unpinned
+
+
 class WorkerSignals(QObject):
     progress = Signal(int)
     completed = Signal(int)
@@ -70,6 +298,9 @@ class WorkerSignals(QObject):
 
 
 class ImageConverter(QRunnable):
+    # Include tracebacks in conversion errors (once per exception type)
+    DEBUG = False
+
     def __init__(
         self,
         files,
@@ -79,6 +310,8 @@ class ImageConverter(QRunnable):
         max_workers,
         replace_files,
         heic_quality=90,
+        verbose=False,
+        webp_method=0,
     ):
         super().__init__()
         self.files = files
@@ -88,152 +321,357 @@ class ImageConverter(QRunnable):
         self.max_workers = max_workers
         self.replace_files = replace_files
         self.heic_quality = heic_quality
+        self.verbose = verbose
+        self.webp_method = webp_method
         self.signals = WorkerSignals()
         self._is_cancelled = False
+        self._log_buffer = []
+        self._last_log_flush = 0.0
 
-    def save_as_heic(self, image, output_path):
-        """Save image as HEIC using pillow_heif directly"""
-        self.signals.log.emit("Using pillow_heif for HEIC output")
-
-        # Convert PIL image to numpy array for OpenCV
-        img_array = np.array(image)
-
-        # Convert RGB to BGR (OpenCV uses BGR)
-        if len(img_array.shape) == 3 and img_array.shape[2] == 3:
-            img_array = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-        elif len(img_array.shape) == 3 and img_array.shape[2] == 4:
-            img_array = cv2.cvtColor(img_array, cv2.COLOR_RGBA2BGRA)
-
-        # Determine mode
-        if len(img_array.shape) == 2:
-            mode = "L"
-        elif img_array.shape[2] == 3:
-            mode = "BGR"
-        elif img_array.shape[2] == 4:
-            mode = "BGRA"
-        else:
-            raise ValueError(f"Unsupported image shape: {img_array.shape}")
+    def cancel(self):
+        self._is_cancelled = True
+        self.signals.log.emit("Conversion cancelled")
+
+    def _queue_log(self, message):
+        """Buffer a log line, sending the batch once it's big or old enough"""
+        self._log_buffer.append(message)
+        if (
+            len(self._log_buffer) >= LOG_FLUSH_LINES
+            or time.monotonic() - self._last_log_flush >= LOG_FLUSH_INTERVAL
+        ):
+            self._flush_logs()
+
+    def _flush_logs(self):
+        if self._log_buffer:
+            self.signals.log.emit("\n".join(self._log_buffer))
+            self._log_buffer = []
+        self._last_log_flush = time.monotonic()
 
-        # Create HEIF file
-        heif_file = pillow_heif.from_bytes(
-            mode=mode,
-            size=(img_array.shape[1], img_array.shape[0]),
-            data=bytes(img_array),
+    @Slot()
+    def run(self):
+        settings = ConversionSettings(
+            self.output_format,
+            self.output_dir,
+            self.append_suffix,
+            self.replace_files,
+            self.heic_quality,
+            self.webp_method,
+            self.DEBUG,
+            self.verbose,
         )
 
-        # Save the file
-        quality = max(0, min(100, self.heic_quality))
-        heif_file.save(output_path, quality=quality)
+        # Drop files already in the output format before they reach the pool
+        files = [
+            file for file in self.files
+            if os.path.splitext(file)[1][1:].upper() != settings.format_name
+        ]
+        skipped = len(self.files) - len(files)
+        if skipped:
+            self._queue_log(
+                f"Skipping {skipped} file(s) already in {self.output_format} format"
+            )
+
+        completed = 0
+        total_files = len(files)
+        last_update = 0.0
+        last_pct = 0
+        scale = 100.0 / total_files if total_files else 0.0
+        traced_error_types = set()
 
-    def convert_image(self, input_path):
+        # Whatever happens below, the GUI has to hear that the batch is over
         try:
-            if self._is_cancelled:
-                return False
+            # Ensure output directory exists, once for the whole batch
+            if not self.replace_files:
+                try:
+                    os.makedirs(self.output_dir, exist_ok=True)
+                except OSError as e:
+                    self._flush_logs()
+                    self.signals.error.emit(
+                        f"Cannot create output directory {self.output_dir}: {str(e)}"
+                    )
+                    return
+
+            # Encoding is CPU-bound, so use processes to get around the GIL.
+            # Always spawn: forking a process that is running Qt threads is unsafe.
+            mp_context = multiprocessing.get_context("spawn")
+            pool_options = {}
+            cpu_plan = _plan_worker_cpus(self.max_workers)
+            if cpu_plan:
+                pool_options["initializer"] = _pin_worker
+                pool_options["initargs"] = (mp_context.Value("i", 0), cpu_plan)
+                # One line for the whole plan, and only when per-file logging is on
+                if self.verbose and files:
+                    self._queue_log(
+                        f"Pinning {len(cpu_plan)} worker(s) to CPUs "
+                        f"{', '.join(map(str, cpu_plan))}"
+                    )
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp_context,
+                **pool_options,
+            ) as executor:
+                # Feed the pool a couple of files per worker at a time instead of
+                # everything up front. Like a bounded queue, this keeps pending
+                # work (and memory) small and limits how many files still have
+                # to finish after a cancel.
+                max_in_flight = 2 * self.max_workers
+                remaining = iter(files)
+                futures = {}
+                cancelling = False
+
+                while True:
+                    for file in itertools.islice(remaining, max_in_flight - len(futures)):
+                        try:
+                            future = executor.submit(convert_image, settings, file)
+                        except concurrent.futures.BrokenExecutor as e:
+                            # A worker process died, so nothing more can be
+                            # submitted. Files in flight fail on their own below.
+                            unsent = [file, *remaining]
+                            remaining = iter(())
+                            for unsent_file in unsent:
+                                self._queue_log(f"Not converted: {unsent_file}")
+                            self._flush_logs()
+                            self.signals.error.emit(
+                                f"Conversion pool stopped, {len(unsent)} file(s) "
+                                f"were not converted: {str(e)}"
+                            )
+                            break
+                        futures[future] = file
+
+                    if not futures:
+                        break
+                    if self._is_cancelled and not cancelling:
+                        # Workers can't see the cancel flag, so stop feeding the
+                        # pool and drop files that haven't started. Files already
+                        # being converted still finish and are reported below.
+                        cancelling = True
+                        remaining = iter(())
+                        running = [future for future in futures if not future.cancel()]
+                        if running:
+                            self._queue_log(
+                                f"Waiting for {len(running)} file(s) already being converted"
+                            )
+
+                    done, _ = concurrent.futures.wait(
+                        futures, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        file = futures.pop(future)
+                        if future.cancelled():
+                            continue
+
+                        try:
+                            success, logs, error = future.result()
+                        except Exception as e:
+                            # e.g. a worker process died while decoding
+                            success, logs = False, []
+                            error = (type(e).__name__, f"Error converting {file}: {str(e)}", None)
+
+                        # Logs go out in batches across files; flush before an
+                        # error so it still shows up after its "Converting" line
+                        for message in logs:
+                            self._queue_log(message)
+                        if error:
+                            error_type, error_msg, error_details = error
+                            # Only the first traceback per exception type is worth showing
+                            if error_details and error_type not in traced_error_types:
+                                traced_error_types.add(error_type)
+                                error_msg = f"{error_msg}\n{error_details}"
+                            self._flush_logs()
+                            self.signals.error.emit(error_msg)
+
+                        # Only count as completed if the conversion was successful
+                        if success:
+                            completed += 1
+
+                        # Cap progress updates so large batches don't flood the GUI thread
+                        now = time.monotonic()
+                        if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                            last_update = now
+                            pct = int(completed * scale)
+                            if pct != last_pct:
+                                last_pct = pct
+                                self.signals.progress.emit(pct)
+                            self.signals.completed.emit(completed)
+        except Exception as e:
+            # e.g. the worker pool could not be started
+            self._flush_logs()
+            self.signals.error.emit(f"Conversion stopped: {str(e)}")
+        finally:
+            # Final update, in case the last results were throttled
+            self._flush_logs()
+            pct = int(completed * scale)
+            if pct != last_pct:
+                self.signals.progress.emit(pct)
+            self.signals.completed.emit(completed)
+            self.signals.finished.emit()
+
+
+def _scan_dir(dir_path, ext_set):
+    """List one directory level, returning (matching files, subdirectories).
+
+    Uses os.scandir so file/directory checks come from the directory
+    listing itself instead of a stat() per entry.
+    """
+    files, subdirs = [], []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            _, dot, ext = entry.name.rpartition(".")
+            # ext_set holds both cases, so .lower() is only needed for
+            # rare mixed-case names like .Jpg
+            if dot and (ext in ext_set or ext.lower() in ext_set) and entry.is_file():
+                files.append(entry.path)
+    return files, subdirs
+
+
+def _walk_image_files(dir_path, ext_set):
+    """Yield matching files anywhere under dir_path"""
+    pending = [dir_path]
+    while pending:
+        try:
+            files, subdirs = _scan_dir(pending.pop(), ext_set)
+        except OSError:
+            continue  # Like os.walk, skip subdirectories we can't read
+        yield from files
+        pending.extend(subdirs)
+
+
+def iter_image_files(dir_path, extensions, recursive=True):
+    """Yield paths of files under dir_path whose name ends with one of extensions.
+
+    Wide trees are walked on a few threads, one top-level subdirectory at
+    a time, so directory reads overlap on fast disks. Results are in no
+    particular order.
+    """
+    # Compare only the lowercased suffix against a set, rather than
+    # lowercasing every full name and trying each extension in turn
+    ext_set = frozenset(ext.lstrip(".").lower() for ext in extensions)
+    ext_set |= frozenset(ext.upper() for ext in ext_set)
+
+    # scandir joins entry names onto the path it was given, so normalizing
+    # the root once yields normalized paths without a normpath per file
+    dir_path = os.path.normpath(dir_path)
+
+    files, subdirs = _scan_dir(dir_path, ext_set)
+    yield from files
+    if not recursive:
+        return
+
+    if len(subdirs) < PARALLEL_SCAN_MIN_SUBDIRS:
+        for subdir in subdirs:
+            yield from _walk_image_files(subdir, ext_set)
+        return
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=PARALLEL_SCAN_WORKERS)
+    try:
+        futures = [
+            executor.submit(list, _walk_image_files(subdir, ext_set))
+            for subdir in subdirs
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ScanSignals(QObject):
+    # Each result carries the id of the scan that produced it
+    finished = Signal(int, list)
+    error = Signal(int, str)
+
+
+class FileScanner(QRunnable):
+    """Collects matching image files on a pool thread, off the GUI thread"""
+
+    def __init__(self, scan_id, dir_path, extensions, recursive):
+        super().__init__()
+        self.scan_id = scan_id
+        self.dir_path = dir_path
+        self.extensions = extensions
+        self.recursive = recursive
+        self.signals = ScanSignals()
+        self._is_cancelled = False
 
-            # Normalize path separators
-            input_path = os.path.normpath(input_path)
+    def cancel(self):
+        self._is_cancelled = True
 
-            # Check if file still exists
-            if not os.path.exists(input_path):
-                self.signals.log.emit(
-                    f"Skipping: {input_path} - file no longer exists"
-                )
-                return False
+    @Slot()
+    def run(self):
+        files = []
+        try:
+            for file_path in iter_image_files(self.dir_path, self.extensions, self.recursive):
+                if self._is_cancelled:
+                    return
+                files.append(file_path)
+        except Exception as e:
+            self.signals.error.emit(self.scan_id, str(e))
+            return
 
-            base_name, ext = os.path.splitext(os.path.basename(input_path))
-            ext = ext[1:].upper()  # Remove the dot and uppercase it
+        # Sort files for consistent display
+        files.sort()
+        self.signals.finished.emit(self.scan_id, files)
 
-            # Skip if converting to the same format
-            if ext == self.output_format.upper():
-                self.signals.log.emit(
-                    f"Skipping: {input_path} - same format conversion"
-                )
-                return False
 
-            if self.append_suffix and not self.replace_files:
-                base_name += "_out"
+class FileListModel(QAbstractListModel):
+    """Flat list of checkable file paths behind the file tree view.
 
-            # Ensure output directory exists
-            if not self.replace_files:
-                os.makedirs(self.output_dir, exist_ok=True)
+    Check states live in a bytearray parallel to the path list, so a
+    directory with tens of thousands of images doesn't cost a
+    QTreeWidgetItem per file.
+    """
 
-            output_dir = self.output_dir if not self.replace_files else os.path.dirname(
-                input_path
-            )
-            output_path = os.path.join(
-                output_dir, f"{base_name}.{self.output_format.lower()}"
-            )
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files = []
+        self._checked = bytearray()
 
-            # Log the conversion attempt
-            self.signals.log.emit(f"Converting: {input_path} to {output_path}")
+    def set_files(self, files):
+        self.beginResetModel()
+        self._files = list(files)
+        self._checked = bytearray(b"\x01") * len(self._files)
+        self.endResetModel()
 
-            # Open image with Pillow
-            image = Image.open(input_path)
+    def clear(self):
+        self.set_files([])
 
-            # Convert to RGB for formats that don't support RGBA
-            if (
-                self.output_format.upper() in ["JPG", "JPEG"]
-                and image.mode in ["RGBA", "P"]
-            ):
-                image = image.convert("RGB")
-                self.signals.log.emit(
-                    f"Converting image to RGB mode for {self.output_format}"
-                )
+    def checked_count(self):
+        return self._checked.count(1)
 
-            # Special handling for HEIC output
-            if self.output_format.upper() == "HEIC":
-                self.save_as_heic(image, output_path)
-            else:
-                # Get the correct format name for PIL
-                pil_format = FORMAT_MAPPING.get(self.output_format, self.output_format)
+    def checked_files(self):
+        return [f for f, checked in zip(self._files, self._checked) if checked]
 
-                # Save with proper format
-                image.save(output_path, format=pil_format)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._files)
 
-            if self.replace_files:
-                os.remove(input_path)
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._files[index.row()]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[index.row()] else Qt.Unchecked
+        return None
 
-            self.signals.log.emit(f"Successfully converted: {input_path}")
-            return True
-        except FileNotFoundError:
-            self.signals.log.emit(
-                f"Skipping: {input_path} - file no longer exists"
-            )
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
             return False
-        except Exception as e:
-            error_details = traceback.format_exc()
-            error_msg = f"Error converting {input_path}: {str(e)}\n{error_details}"
-            self.signals.error.emit(error_msg)
-            return False
-
-    def cancel(self):
-        self._is_cancelled = True
-        self.signals.log.emit("Conversion cancelled")
-
-    @Slot()
-    def run(self):
-        completed = 0
-        total_files = len(self.files)
+        self._checked[index.row()] = Qt.CheckState(value) == Qt.Checked
+        self.dataChanged.emit(index, index, [role])
+        return True
 
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.max_workers
-        ) as executor:
-            futures = {
-                executor.submit(self.convert_image, file): file for file in self.files
-            }
-
-            for future in concurrent.futures.as_completed(futures):
-                if self._is_cancelled:
-                    break
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
 
-                # Only count as completed if the conversion was successful
-                if future.result():
-                    completed += 1
-
-                self.signals.progress.emit(int(completed * 100 / total_files))
-                self.signals.completed.emit(completed)
-
-        self.signals.finished.emit()
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return "Files for Conversion"
+        return None
 
 
 class MainWindow(QMainWindow):
@@ -248,6 +686,8 @@ class MainWindow(QMainWindow):
         self.current_dir = None
         self.is_processing = False
         self.output_dir_set = False  # Flag to track if output dir is set
+        self.scanner = None
+        self.scan_id = 0  # Bumped per scan so stale results can be ignored
 
         # Prepare input formats for the combobox
         self.input_formats = {"Auto-detect": []} # Auto-detect maps to all extensions
@@ -344,9 +784,11 @@ class MainWindow(QMainWindow):
         input_layout.addLayout(input_format_layout)
 
         # File tree view
-        self.file_tree_widget = QTreeWidget()
-        self.file_tree_widget.setColumnCount(1)
-        self.file_tree_widget.setHeaderLabels(["Files for Conversion"])
+        self.file_list_model = FileListModel(self)
+        self.file_tree_widget = QTreeView()
+        self.file_tree_widget.setModel(self.file_list_model)
+        self.file_tree_widget.setRootIsDecorated(False)
+        self.file_tree_widget.setUniformRowHeights(True)
         self.file_tree_widget.setToolTip("Lists image files found. Check/uncheck files to include/exclude them from conversion.")
         input_layout.addWidget(self.file_tree_widget)
         
@@ -376,11 +818,26 @@ class MainWindow(QMainWindow):
         self.heic_quality_layout.addWidget(self.heic_quality_spin)
         self.heic_quality_layout.addStretch()
 
+        # WEBP encoder effort setting
+        self.webp_method_layout = QHBoxLayout()
+        self.webp_method_layout.addWidget(QLabel("WEBP Effort:"))
+        self.webp_method_spin = QSpinBox()
+        self.webp_method_spin.setMinimum(0)
+        self.webp_method_spin.setMaximum(6)
+        self.webp_method_spin.setValue(0)
+        self.webp_method_spin.setToolTip(
+            "0 is fastest; higher values spend more time searching for smaller files."
+        )
+        self.webp_method_layout.addWidget(self.webp_method_spin)
+        self.webp_method_layout.addStretch()
+
         self.output_layout.addLayout(format_layout)
         self.output_layout.addLayout(self.heic_quality_layout)
+        self.output_layout.addLayout(self.webp_method_layout)
 
-        # Connect format combo to show/hide HEIC quality setting
+        # Connect format combo to show/hide HEIC quality and WEBP effort settings
         self.format_combo.currentTextChanged.connect(self.toggle_heic_quality)
+        self.format_combo.currentTextChanged.connect(self.toggle_webp_method)
 
         self.output_dir_group = QWidget()
         self.output_dir_layout = QVBoxLayout(self.output_dir_group)
@@ -439,6 +896,14 @@ class MainWindow(QMainWindow):
         self.log_text.setReadOnly(True)
         log_layout.addWidget(self.log_text)
 
+        self.verbose_log_check = QCheckBox("Log every file")
+        self.verbose_log_check.setChecked(False)
+        self.verbose_log_check.setToolTip(
+            "Add a log line for each file as it is converted. Errors are always logged; "
+            "leave this off for large batches."
+        )
+        log_layout.addWidget(self.verbose_log_check)
+
         clear_log_btn = QPushButton("Clear Log")
         clear_log_btn.clicked.connect(self.clear_log)
         log_layout.addWidget(clear_log_btn)
@@ -478,42 +943,27 @@ class MainWindow(QMainWindow):
         self.log_text.append(
             "Supported output formats: " + ", ".join(SUPPORTED_OUTPUT_FORMATS)
         )
+        self.log_text.append(f"JPEG codec: {describe_jpeg_codec()}")
 
-        # Initial state for HEIC quality
+        # Initial state for HEIC quality and WEBP effort
         self.toggle_heic_quality(self.format_combo.currentText())
+        self.toggle_webp_method(self.format_combo.currentText())
 
         # Initial state for output options
         self.toggle_output_group(self.replace_files_check.checkState())
 
-        # Connect itemChanged signal for the tree widget
-        if hasattr(self, 'file_tree_widget'):
-            self.file_tree_widget.itemChanged.connect(self.update_active_file_count)
+        # Keep the selected count in sync with check/uncheck in the tree
+        if hasattr(self, 'file_list_model'):
+            self.file_list_model.dataChanged.connect(self.update_active_file_count)
 
 
-    def update_active_file_count(self, item=None): # item is passed by the signal but not always needed
+    def update_active_file_count(self, *args): # dataChanged passes indexes/roles we don't need
         """Updates the active_files_label and convert_btn state based on checked items."""
-        if not hasattr(self, 'file_tree_widget'):
+        if not hasattr(self, 'file_list_model'):
             return
 
-        checked_count = 0
-        total_items = 0
-        root = self.file_tree_widget.invisibleRootItem()
-        
-        # If current_dir is None, it means we are in single file mode or no dir selected
-        # In this case, total_items should be the number of items currently in the tree.
-        if self.current_dir is None:
-            total_items = root.childCount()
-        else:
-            # If a directory is selected, total_items is len(self.files_to_convert)
-            # which represents all files found by collect_files, not just what's in tree.
-            # This needs to be from the tree itself for "X of Y" to make sense.
-            total_items = root.childCount()
-
-
-        for i in range(root.childCount()):
-            tree_item = root.child(i)
-            if tree_item.checkState(0) == Qt.Checked:
-                checked_count += 1
+        checked_count = self.file_list_model.checked_count()
+        total_items = self.file_list_model.rowCount()
         
         if hasattr(self, 'active_files_label'):
             self.active_files_label.setText(f"{checked_count} of {total_items} files selected")
@@ -529,6 +979,14 @@ class MainWindow(QMainWindow):
             if item and item.widget():
                 item.widget().setVisible(show_quality)
 
+    def toggle_webp_method(self, format_text):
+        """Show or hide WEBP effort settings based on selected format"""
+        show_method = format_text.upper() == "WEBP"
+        for i in range(self.webp_method_layout.count()):
+            item = self.webp_method_layout.itemAt(i)
+            if item and item.widget():
+                item.widget().setVisible(show_method)
+
     def toggle_output_group(self, state):
         """Show or hide the entire output group box based on the replace files checkbox"""
         replace_files = state == Qt.Checked
@@ -571,6 +1029,7 @@ class MainWindow(QMainWindow):
             self, "Select Image File", "", file_filter
         )
         if file_path:
+            self.cancel_scan()
             self.input_path_edit.setText(file_path)
             self.current_dir = None # Single file mode, so no current directory for refresh
             self.files_to_convert = [file_path] # This list will be used by update_file_list_display
@@ -604,49 +1063,33 @@ class MainWindow(QMainWindow):
         """Update the count of files in the selected directory"""
         if not self.current_dir or self.is_processing:
             # Clear tree and label if no directory is selected or if processing
-            if hasattr(self, 'file_tree_widget'): # Ensure widget exists
-                self.file_tree_widget.clear()
+            self.cancel_scan()
+            if hasattr(self, 'file_list_model'): # Ensure model exists
+                self.file_list_model.clear()
             if hasattr(self, 'active_files_label'): # Ensure widget exists
                 self.active_files_label.setText("0 files selected for conversion")
             self.convert_btn.setEnabled(False)
             self.files_processed_label.setText(f"0/0 files processed")
             return
 
-        try:
-            # Clear the tree before populating
-            if hasattr(self, 'file_tree_widget'):
-                self.file_tree_widget.clear()
-            
-            self.collect_files(self.current_dir, self.recursive_check.isChecked())
-            
-            if hasattr(self, 'file_tree_widget'): # Ensure widget exists
-                self.file_tree_widget.clear() # Clear tree here before collect_files potentially adds to self.files_to_convert
-            
-            self.collect_files(self.current_dir, self.recursive_check.isChecked())
-            
-            # After collecting files, update the display which includes populating the tree
-            self.update_file_list_display()
+        # Clear the tree while the background scan runs
+        self.files_to_convert = []
+        if hasattr(self, 'file_list_model'):
+            self.file_list_model.clear()
+        if hasattr(self, 'active_files_label'):
+            self.active_files_label.setText("Scanning for files...")
+        self.convert_btn.setEnabled(False)
 
-            # Log the update (count is now handled in update_file_list_display)
-            # self.log_text.append(f"Updated file list: {len(self.files_to_convert)} image files found based on current selection.")
-        except Exception as e:
-            self.log_text.append(f"Error updating file count: {str(e)}")
-            QMessageBox.critical(
-                self, "Error", f"Failed to scan directory: {str(e)}"
-            )
+        # Results arrive in on_files_collected / on_scan_error
+        self.collect_files(self.current_dir, self.recursive_check.isChecked())
 
     def update_file_list_display(self):
         """Updates the file tree widget and related UI elements based on self.files_to_convert."""
-        if not hasattr(self, 'file_tree_widget'): # Should not happen
+        if not hasattr(self, 'file_list_model'): # Should not happen
             return
-            
-        self.file_tree_widget.clear()
-        
-        for file_path in self.files_to_convert: # Assumes self.files_to_convert is already set
-            item = QTreeWidgetItem(self.file_tree_widget)
-            item.setText(0, file_path)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(0, Qt.Checked)
+
+        # One model reset for the whole list, all files checked
+        self.file_list_model.set_files(self.files_to_convert)
 
         count = len(self.files_to_convert)
         if hasattr(self, 'active_files_label'): # Ensure widget exists
@@ -677,8 +1120,16 @@ class MainWindow(QMainWindow):
             self.output_dir_set = True
             self.last_output_dir = dir_path  # Store the directory
 
+    def cancel_scan(self):
+        """Stop any in-flight directory scan and discard its results"""
+        self.scan_id += 1
+        if self.scanner:
+            self.scanner.cancel()
+            self.scanner = None
+
     def collect_files(self, dir_path, recursive=True):
-        self.files_to_convert = []
+        """Start scanning dir_path in the background, replacing any running scan"""
+        self.cancel_scan()
         selected_format = self.input_format_combo.currentText()
         
         if selected_format == "Auto-detect":
@@ -692,36 +1143,33 @@ class MainWindow(QMainWindow):
             self.log_text.append(f"Warning: No extensions found for format {selected_format}. Defaulting to all.")
             extensions_to_check = SUPPORTED_INPUT_EXTENSIONS
 
-        try:
-            if recursive:
-                for root, _, files in os.walk(dir_path):
-                    for file in files:
-                        if file.lower().endswith(extensions_to_check):
-                            # Normalize path
-                            file_path = os.path.normpath(os.path.join(root, file))
-                            self.files_to_convert.append(file_path)
-            else:
-                for file in os.listdir(dir_path):
-                    if file.lower().endswith(extensions_to_check):
-                        # Normalize path
-                        file_path = os.path.normpath(os.path.join(dir_path, file))
-                        self.files_to_convert.append(file_path)
+        self.scanner = FileScanner(self.scan_id, dir_path, extensions_to_check, recursive)
+        self.scanner.signals.finished.connect(self.on_files_collected)
+        self.scanner.signals.error.connect(self.on_scan_error)
+        QThreadPool.globalInstance().start(self.scanner)
 
-            # Sort files for consistent display
-            self.files_to_convert.sort()
+    def on_files_collected(self, scan_id, files):
+        if scan_id != self.scan_id or self.is_processing:
+            return  # Superseded by a newer scan or a conversion
+        self.scanner = None
+        self.files_to_convert = files
+        self.update_file_list_display()
 
-        except Exception as e:
-            self.log_text.append(f"Error collecting files: {str(e)}")
-            QMessageBox.critical(
-                self, "Error", f"Failed to scan directory: {str(e)}"
-            )
+    def on_scan_error(self, scan_id, error_msg):
+        if scan_id != self.scan_id:
+            return
+        self.scanner = None
+        if hasattr(self, 'active_files_label'):
+            self.active_files_label.setText("0 files selected for conversion")
+        self.log_text.append(f"Error collecting files: {error_msg}")
+        QMessageBox.critical(
+            self, "Error", f"Failed to scan directory: {error_msg}"
+        )
 
     def start_conversion(self):
         output_dir = self.output_dir_edit.text()
         try:
-            if not self.replace_files_check.isChecked():
-                os.makedirs(output_dir, exist_ok=True)
-
+            # The output directory is created by ImageConverter.run, off the GUI thread
             self.progress_bar.setValue(0)
             self.progress_label.setText("Converting...")
             self.convert_btn.setEnabled(False)
@@ -730,12 +1178,7 @@ class MainWindow(QMainWindow):
             # Mark as processing - this locks the file list
             self.is_processing = True
 
-            files_to_process = []
-            root = self.file_tree_widget.invisibleRootItem()
-            for i in range(root.childCount()):
-                item = root.child(i)
-                if item.checkState(0) == Qt.Checked:
-                    files_to_process.append(item.text(0))
+            files_to_process = self.file_list_model.checked_files()
             
             total_files = len(files_to_process)
 
@@ -761,6 +1204,8 @@ class MainWindow(QMainWindow):
                 self.workers_spin.value(),
                 self.replace_files_check.isChecked(),
                 self.heic_quality_spin.value(),
+                self.verbose_log_check.isChecked(),
+                self.webp_method_spin.value(),
             )
 
             self.converter.signals.progress.connect(self.update_progress)
@@ -825,6 +1270,8 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Needed for the conversion process pool in the frozen build
+    multiprocessing.freeze_support()
     if platform.system() == "Windows":
         myappid = "image.format.converter.gui"
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)